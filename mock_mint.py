@@ -7,25 +7,56 @@ eCash mint without requiring actual network connections or real value.
 """
 
 import asyncio
-import hashlib
+import itertools
 import logging
+import random
 import secrets
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional
+
+
+# Instance numbers for auto-generated mint names; next() on a count is a
+# single C call, unlike a read-modify-write on a class attribute
+_MINT_COUNTER = itertools.count(1)
+
+# Counters summed by MockMint.aggregate_stats
+_AGGREGATE_FIELDS = (
+    'total_minted',
+    'total_redeemed',
+    'total_amount_minted',
+    'total_amount_redeemed',
+    'active_tokens',
+)
 
 
 class BearerToken:
     """Represents a simulated Cashu bearer token."""
     
+    __slots__ = (
+        'mint_id',
+        'mint_id_short8',
+        'mint_id_short16',
+        'amount',
+        'token_data',
+        'timestamp',
+        'created_at_iso',
+        'token_id',
+    )
+    
     def __init__(self, mint_id: str, amount: int, token_data: str, timestamp: float):
         self.mint_id = mint_id
+        # Short mint ID prefixes used in log lines and reprs
+        self.mint_id_short8 = mint_id[:8]
+        self.mint_id_short16 = mint_id[:16]
         self.amount = amount
         self.token_data = token_data
         self.timestamp = timestamp
-        self.token_id = hashlib.sha256(
-            f"{mint_id}{amount}{token_data}{timestamp}".encode()
-        ).hexdigest()[:16]
+        self.created_at_iso = datetime.fromtimestamp(timestamp).isoformat()
+        # token_data is already random, so an independent random ID is just as
+        # unique as hashing it and avoids a SHA-256 per minted token
+        self.token_id = secrets.token_hex(8)
     
     def to_dict(self) -> Dict:
         """Convert token to dictionary representation."""
@@ -35,11 +66,21 @@ class BearerToken:
             'amount': self.amount,
             'token_data': self.token_data,
             'timestamp': self.timestamp,
-            'created_at': datetime.fromtimestamp(self.timestamp).isoformat()
+            'created_at': self.created_at_iso
         }
     
     def __repr__(self) -> str:
-        return f"BearerToken(id={self.token_id}, mint={self.mint_id[:8]}..., amount={self.amount})"
+        return f"BearerToken(id={self.token_id}, mint={self.mint_id_short8}..., amount={self.amount})"
+
+
+class RedemptionResult(NamedTuple):
+    """Outcome of a MockMint.redeem_tokens call."""
+    
+    mint_id: str
+    mint_name: str
+    redeemed_tokens: List[str]
+    total_amount: int
+    redemption_timestamp: float
 
 
 class MockMint:
@@ -53,9 +94,13 @@ class MockMint:
     - Comprehensive operation logging
     """
     
-    _instance_counter = 0
-    
-    def __init__(self, name: Optional[str] = None, min_latency_ms: int = 50, max_latency_ms: int = 200):
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        min_latency_ms: int = 50,
+        max_latency_ms: int = 200,
+        retain_history: bool = False
+    ):
         """
         Initialize a MockMint instance.
         
@@ -63,37 +108,37 @@ class MockMint:
             name: Optional name for the mint (auto-generated if not provided)
             min_latency_ms: Minimum simulated network latency in milliseconds
             max_latency_ms: Maximum simulated network latency in milliseconds
+            retain_history: Keep every issued and redeemed token for inspection
         """
-        MockMint._instance_counter += 1
-        self.mint_id = hashlib.sha256(
-            f"{name or 'MockMint'}{MockMint._instance_counter}{time.time()}".encode()
-        ).hexdigest()
-        self.name = name or f"MockMint-{MockMint._instance_counter:02d}"
+        self._instance_num = next(_MINT_COUNTER)
+        self.mint_id = secrets.token_hex(32)
+        # Short mint ID prefixes used in log lines and reprs
+        self.mint_id_short8 = self.mint_id[:8]
+        self.mint_id_short16 = self.mint_id[:16]
+        self.name = name or f"MockMint-{self._instance_num:02d}"
         self.min_latency = min_latency_ms / 1000.0
         self.max_latency = max_latency_ms / 1000.0
+        self._latency_span = self.max_latency - self.min_latency
         self.logger = logging.getLogger(__name__)
         
-        # Track issued and redeemed tokens
+        # Track issued and redeemed tokens (only populated with retain_history)
+        self.retain_history = retain_history
         self.issued_tokens: Dict[str, BearerToken] = {}
         self.redeemed_tokens: Dict[str, BearerToken] = {}
         
         # Statistics
-        self.total_minted = 0
-        self.total_redeemed = 0
-        self.total_amount_minted = 0
-        self.total_amount_redeemed = 0
+        self.reset_stats()
         
         self.logger.info(
             f"[MINT_INIT] Initialized {self.name} | "
-            f"mint_id={self.mint_id[:16]}... | "
+            f"mint_id={self.mint_id_short16}... | "
             f"latency={self.min_latency*1000:.0f}-{self.max_latency*1000:.0f}ms"
         )
     
     async def _simulate_latency(self):
         """Simulate network latency with random delay."""
-        latency = secrets.randbelow(int((self.max_latency - self.min_latency) * 1000)) / 1000.0
-        latency += self.min_latency
-        await asyncio.sleep(latency)
+        # Simulated latency needs no cryptographic randomness
+        await asyncio.sleep(self.min_latency + random.random() * self._latency_span)
     
     async def mint_tokens(self, amount: int, source_data: Optional[str] = None) -> List[BearerToken]:
         """
@@ -118,22 +163,31 @@ class MockMint:
             timestamp=timestamp
         )
         
-        self.issued_tokens[token.token_id] = token
+        if self.retain_history:
+            self.issued_tokens[token.token_id] = token
         self.total_minted += 1
+        self.active_tokens += 1
         self.total_amount_minted += amount
         
-        self.logger.info(
-            f"[MINT_TOKENS] {self.name} | "
-            f"token_id={token.token_id} | "
-            f"amount={amount} | "
-            f"source={source_data or 'N/A'} | "
-            f"token_data={token_data[:16]}... | "
-            f"timestamp={datetime.fromtimestamp(timestamp).isoformat()}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "[MINT_TOKENS] %s | "
+                "token_id=%s | "
+                "amount=%d | "
+                "source=%s | "
+                "token_data=%s... | "
+                "timestamp=%s",
+                self.name,
+                token.token_id,
+                amount,
+                source_data or 'N/A',
+                token_data[:16],
+                token.created_at_iso
+            )
         
         return [token]
     
-    async def redeem_tokens(self, tokens: List[BearerToken]) -> Dict:
+    async def redeem_tokens(self, tokens: List[BearerToken]) -> RedemptionResult:
         """
         Redeem bearer tokens.
         
@@ -141,12 +195,15 @@ class MockMint:
             tokens: List of BearerToken objects to redeem
             
         Returns:
-            Dictionary with redemption details
+            RedemptionResult with redemption details
         """
         await self._simulate_latency()
         
         total_amount = 0
         redeemed_token_ids = []
+        # Sample the clock once; every token in the batch shares this time
+        redemption_timestamp = time.time()
+        redemption_time = datetime.fromtimestamp(redemption_timestamp).isoformat()
         
         for token in tokens:
             # Validate token (in mock, we accept any token from any mint)
@@ -154,34 +211,53 @@ class MockMint:
             redeemed_token_ids.append(token.token_id)
             
             # Mark as redeemed
-            self.redeemed_tokens[token.token_id] = token
+            if self.retain_history:
+                self.redeemed_tokens[token.token_id] = token
             self.total_redeemed += 1
+            self.active_tokens -= 1
             self.total_amount_redeemed += token.amount
             
-            self.logger.info(
-                f"[REDEEM_TOKEN] {self.name} | "
-                f"token_id={token.token_id} | "
-                f"original_mint={token.mint_id[:16]}... | "
-                f"amount={token.amount} | "
-                f"redemption_time={datetime.now().isoformat()}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "[REDEEM_TOKEN] %s | "
+                    "token_id=%s | "
+                    "original_mint=%s... | "
+                    "amount=%d | "
+                    "redemption_time=%s",
+                    self.name,
+                    token.token_id,
+                    token.mint_id_short16,
+                    token.amount,
+                    redemption_time
+                )
         
-        result = {
-            'mint_id': self.mint_id,
-            'mint_name': self.name,
-            'redeemed_tokens': redeemed_token_ids,
-            'total_amount': total_amount,
-            'redemption_timestamp': time.time()
-        }
+        result = RedemptionResult(
+            mint_id=self.mint_id,
+            mint_name=self.name,
+            redeemed_tokens=redeemed_token_ids,
+            total_amount=total_amount,
+            redemption_timestamp=redemption_timestamp
+        )
         
         self.logger.info(
-            f"[REDEEM_COMPLETE] {self.name} | "
-            f"tokens_redeemed={len(tokens)} | "
-            f"total_amount={total_amount}"
+            "[REDEEM_COMPLETE] %s | "
+            "tokens_redeemed=%d | "
+            "total_amount=%d",
+            self.name, len(tokens), total_amount
         )
         
         return result
     
+    def reset_stats(self):
+        """Clear statistics counters and any retained token history."""
+        self.issued_tokens.clear()
+        self.redeemed_tokens.clear()
+        self.total_minted = 0
+        self.total_redeemed = 0
+        self.total_amount_minted = 0
+        self.total_amount_redeemed = 0
+        self.active_tokens = 0
+    
     def get_stats(self) -> Dict:
         """Get mint statistics."""
         return {
@@ -191,11 +267,21 @@ class MockMint:
             'total_redeemed': self.total_redeemed,
             'total_amount_minted': self.total_amount_minted,
             'total_amount_redeemed': self.total_amount_redeemed,
-            'active_tokens': len(self.issued_tokens) - len(self.redeemed_tokens)
+            'active_tokens': self.active_tokens
         }
     
+    @staticmethod
+    def aggregate_stats(mints: List["MockMint"]) -> Dict:
+        """
+        Sum statistics counters across mints.
+        
+        Reads the counters directly instead of building a get_stats()
+        dict per mint.
+        """
+        return {field: sum(map(attrgetter(field), mints)) for field in _AGGREGATE_FIELDS}
+    
     def __repr__(self) -> str:
-        return f"MockMint(name={self.name}, id={self.mint_id[:8]}...)"
+        return f"MockMint(name={self.name}, id={self.mint_id_short8}...)"
 
 
 async def test_mock_mint():
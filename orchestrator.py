@@ -7,21 +7,46 @@ to achieve transactional privacy through custody chain severance.
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import random
+import string
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from mock_mint import BearerToken, MockMint
 
 
+_get_mint_id = attrgetter('mint_id')
+
+# Listener started by setup_logging; set once logging is configured
+_log_listener: Optional[QueueListener] = None
+
+
 # Configure comprehensive logging
 def setup_logging():
-    """Configure verbose logging to dfir/ directory."""
+    """
+    Configure verbose logging to dfir/ directory.
+    
+    Records are handed to a QueueHandler and written by a QueueListener
+    thread, so the file and console writes never block the event loop.
+    The listener is stopped (and the queue drained) at interpreter exit.
+    
+    Safe to call more than once: later calls reuse the existing setup
+    instead of attaching duplicate handlers.
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        return logging.getLogger(__name__)
+    
     dfir_dir = Path("dfir")
     dfir_dir.mkdir(exist_ok=True)
     
@@ -34,7 +59,7 @@ def setup_logging():
     )
     
     # File handler
-    file_handler = logging.FileHandler(log_file, mode='a')
+    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
     
@@ -43,15 +68,39 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
+    # Background listener owns the blocking handlers
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
     # Root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     
     return logging.getLogger(__name__)
 
 
+def flush_logging():
+    """
+    Write out every record queued so far.
+    
+    Stopping the listener drains the queue through the file and console
+    handlers; it is then restarted so later records are still written.
+    Does nothing if setup_logging has not been called.
+    """
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener.start()
+
+
 class DigitalPurgatoryOrchestrator:
     """
     Main orchestrator for the Digital Purgatory Protocol.
@@ -60,6 +109,9 @@ class DigitalPurgatoryOrchestrator:
     to sever the custody chain and achieve transactional privacy.
     """
     
+    # Random draws attempted before falling back to filtering the pool
+    MAX_SELECTION_ATTEMPTS = 8
+    
     def __init__(self, num_hops: int = 10, num_mints: int = 15):
         """
         Initialize the orchestrator.
@@ -72,6 +124,8 @@ class DigitalPurgatoryOrchestrator:
         self.num_hops = num_hops
         self.num_mints = num_mints
         self.vendor_pool: List[MockMint] = []
+        # Mint IDs in the vendor pool, for O(1) membership checks
+        self.mint_id_set: FrozenSet[str] = frozenset()
         
         self.logger.info(
             f"[ORCHESTRATOR_INIT] Initializing Digital Purgatory Protocol | "
@@ -87,15 +141,22 @@ class DigitalPurgatoryOrchestrator:
         """
         self.logger.info(f"[VENDOR_DISCOVERY] Initiating vendor discovery for {self.num_mints} mints...")
         
-        for i in range(self.num_mints):
-            mint = MockMint(
-                name=f"Vendor-{chr(65 + i % 26)}{i // 26 + 1}",
+        letters = string.ascii_uppercase
+        discovered = [
+            MockMint(
+                name=f"Vendor-{letters[i % 26]}{i // 26 + 1}",
                 min_latency_ms=30,
                 max_latency_ms=150
             )
-            self.vendor_pool.append(mint)
+            for i in range(self.num_mints)
+        ]
+        self.vendor_pool.extend(discovered)
+        self.mint_id_set = frozenset(map(_get_mint_id, self.vendor_pool))
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"[VENDOR_DISCOVERED] {mint.name} | mint_id={mint.mint_id[:16]}..."
+                "[VENDOR_DISCOVERED] %s",
+                ", ".join(f"{m.name}={m.mint_id_short16}..." for m in discovered)
             )
         
         self.logger.info(
@@ -114,21 +175,58 @@ class DigitalPurgatoryOrchestrator:
         Returns:
             Selected MockMint instance
         """
-        exclude = exclude or []
-        available_mints = [m for m in self.vendor_pool if m.mint_id not in exclude]
-        
-        if not available_mints:
-            self.logger.warning("[MINT_SELECTION] No available mints, using full pool")
-            available_mints = self.vendor_pool
+        pool_size = len(self.vendor_pool)
         
-        selected = random.choice(available_mints)
+        if not exclude:
+            # Nothing to exclude (e.g. hop 0): a single draw is enough
+            selected = self.vendor_pool[random.randrange(pool_size)]
+        else:
+            exclude_set = frozenset(exclude)
+            
+            # Rejection sampling: exclude is usually just the previous mint, so
+            # the first draw almost always succeeds without building a filtered list
+            for _ in range(self.MAX_SELECTION_ATTEMPTS):
+                selected = self.vendor_pool[random.randrange(pool_size)]
+                if selected.mint_id not in exclude_set:
+                    break
+            else:
+                available_mints = [m for m in self.vendor_pool if m.mint_id not in exclude_set]
+                
+                if not available_mints:
+                    self.logger.warning("[MINT_SELECTION] No available mints, using full pool")
+                    available_mints = self.vendor_pool
+                
+                selected = random.choice(available_mints)
+        
+        self._log_selection(hop_number, selected)
+        return selected
+    
+    def _log_selection(self, hop_number: int, mint: MockMint):
+        """Log the mint chosen for a hop."""
         self.logger.debug(
-            f"[MINT_SELECTED] Hop {hop_number} | "
-            f"mint={selected.name} | "
-            f"mint_id={selected.mint_id[:16]}..."
+            "[MINT_SELECTED] Hop %d | "
+            "mint=%s | "
+            "mint_id=%s...",
+            hop_number, mint.name, mint.mint_id_short16
         )
+    
+    def _next_hop_mint(
+        self,
+        picks: Iterator[MockMint],
+        hop_number: int,
+        previous_mint_id: str
+    ) -> MockMint:
+        """
+        Take the next pre-drawn mint that differs from the previous one.
         
-        return selected
+        Falls back to select_mint_for_hop once the picks are exhausted.
+        """
+        for candidate in picks:
+            if candidate.mint_id != previous_mint_id:
+                self._log_selection(hop_number, candidate)
+                return candidate
+        
+        return self.select_mint_for_hop(hop_number, exclude=[previous_mint_id])
     
     async def transmigration_initiation(self, original_data: int, source_id: str = "original_source") -> List[BearerToken]:
         """
@@ -185,41 +283,70 @@ class DigitalPurgatoryOrchestrator:
         Returns:
             List of new BearerToken objects
         """
-        original_mint_ids = [t.mint_id[:16] for t in tokens]
-        total_amount = sum(t.amount for t in tokens)
+        return [await self._redeem_and_mint_one(tokens, target_mint, hop_number)]
+    
+    async def _redeem_and_mint_one(
+        self,
+        tokens: List[BearerToken],
+        target_mint: MockMint,
+        hop_number: int
+    ) -> BearerToken:
+        """
+        Redeem tokens at target_mint and return the one fresh token it mints.
         
-        self.logger.info(
-            f"[HOP_{hop_number}_REDEEM] Redeeming at {target_mint.name} | "
-            f"tokens={len(tokens)} | "
-            f"amount={total_amount} | "
-            f"original_mints={original_mint_ids}"
-        )
+        Shared by execute_cross_vendor_redemption and the hop loop, which
+        carries a single token per hop and uses the result directly.
+        """
+        # Step records are DEBUG only; skip building them when that is off
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "[HOP_%d_REDEEM] Redeeming at %s | "
+                "tokens=%d | "
+                "amount=%d | "
+                "original_mints=%s",
+                hop_number, target_mint.name, len(tokens),
+                sum(t.amount for t in tokens),
+                [t.mint_id_short16 for t in tokens]
+            )
         
         # Redeem tokens at target mint
         redemption = await target_mint.redeem_tokens(tokens)
         
-        self.logger.info(
-            f"[HOP_{hop_number}_REDEMPTION_COMPLETE] "
-            f"mint={target_mint.name} | "
-            f"redeemed_amount={redemption['total_amount']}"
-        )
-        
-        # Mint new tokens at the same mint
-        self.logger.info(
-            f"[HOP_{hop_number}_MINT] Minting fresh tokens at {target_mint.name} | "
-            f"amount={redemption['total_amount']}"
-        )
-        
-        new_tokens = await target_mint.mint_tokens(redemption['total_amount'])
+        if debug:
+            self.logger.debug(
+                "[HOP_%d_REDEMPTION_COMPLETE] "
+                "mint=%s | "
+                "redeemed_amount=%d",
+                hop_number, target_mint.name, redemption.total_amount
+            )
+            
+            # Mint a fresh token at the same mint
+            self.logger.debug(
+                "[HOP_%d_MINT] Minting fresh tokens at %s | "
+                "amount=%d",
+                hop_number, target_mint.name, redemption.total_amount
+            )
         
-        self.logger.info(
-            f"[HOP_{hop_number}_COMPLETE] Custody chain severed | "
-            f"old_tokens={[t.token_id for t in tokens]} | "
-            f"new_tokens={[t.token_id for t in new_tokens]} | "
-            f"mint={target_mint.name}"
-        )
+        new_token = (await target_mint.mint_tokens(redemption.total_amount))[0]
+        
+        # One structured INFO record per hop; the steps above are DEBUG only
+        if self.logger.isEnabledFor(logging.INFO):
+            hop_record = {
+                'hop': hop_number,
+                'target': target_mint.name,
+                'tokens_in': [t.token_id for t in tokens],
+                'tokens_out': [new_token.token_id],
+                'amount': redemption.total_amount
+            }
+            self.logger.info(
+                "[HOP_%d_COMPLETE] Custody chain severed | %s",
+                hop_number,
+                hop_record,
+                extra={'hop': hop_record}
+            )
         
-        return new_tokens
+        return new_token
     
     async def iterative_obfuscation_loop(
         self,
@@ -242,57 +369,110 @@ class DigitalPurgatoryOrchestrator:
             Final BearerToken objects after all hops
         """
         self.logger.info(
-            f"[OBFUSCATION_LOOP_START] Starting {self.num_hops}-hop transmigration | "
-            f"amount={initial_amount} | source={source_id}"
+            "[OBFUSCATION_LOOP_START] Starting %d-hop transmigration | "
+            "amount=%d | source=%s",
+            self.num_hops, initial_amount, source_id
         )
         
         start_time = datetime.now()
         
-        # Hop 0: Initial minting
-        current_tokens = await self.transmigration_initiation(initial_amount, source_id)
-        previous_mint_id = current_tokens[0].mint_id
+        # Hop 0: Initial minting (each mint operation issues a single token)
+        current_token = (await self.transmigration_initiation(initial_amount, source_id))[0]
+        
+        # Draw hop mints in bulk, oversampling so that skipping repeats of the
+        # previous mint rarely exhausts the picks
+        hop_picks = iter(random.choices(self.vendor_pool, k=self.num_hops * 2))
         
         # Hops 1 through N
         for hop in range(1, self.num_hops + 1):
-            self.logger.info(f"[HOP_{hop}] Starting hop {hop}/{self.num_hops}")
+            self.logger.debug("[HOP_%d] Starting hop %d/%d", hop, hop, self.num_hops)
             
             # Select a different mint from the previous one
-            target_mint = self.select_mint_for_hop(hop, exclude=[previous_mint_id])
+            target_mint = self._next_hop_mint(hop_picks, hop, current_token.mint_id)
             
             # Execute cross-vendor redemption and minting
-            current_tokens = await self.execute_cross_vendor_redemption(
-                current_tokens,
-                target_mint,
-                hop
-            )
+            current_token = await self._redeem_and_mint_one([current_token], target_mint, hop)
             
-            previous_mint_id = current_tokens[0].mint_id
-            
-            self.logger.info(
-                f"[HOP_{hop}_STATUS] Hop complete | "
-                f"tokens={len(current_tokens)} | "
-                f"current_mint={target_mint.name}"
+            self.logger.debug(
+                "[HOP_%d_STATUS] Hop complete | "
+                "tokens=1 | "
+                "current_mint=%s",
+                hop, target_mint.name
             )
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
         self.logger.info(
-            f"[OBFUSCATION_LOOP_COMPLETE] Transmigration complete | "
-            f"hops={self.num_hops} | "
-            f"duration={duration:.2f}s | "
-            f"final_tokens={[t.token_id for t in current_tokens]} | "
-            f"final_mint={current_tokens[0].mint_id[:16]}..."
+            "[OBFUSCATION_LOOP_COMPLETE] Transmigration complete | "
+            "hops=%d | "
+            "duration=%.2fs | "
+            "final_tokens=['%s'] | "
+            "final_mint=%s...",
+            self.num_hops,
+            duration,
+            current_token.token_id,
+            current_token.mint_id_short16
         )
         
-        return current_tokens
+        return [current_token]
     
-    def get_vendor_statistics(self) -> dict:
-        """Get statistics for all vendors in the pool."""
+    async def iterative_obfuscation_batch(
+        self,
+        amounts: List[int],
+        source_id: str = "source_data"
+    ) -> List[List[BearerToken]]:
+        """
+        Execute several independent transmigration cycles concurrently.
+        
+        Hops within a single cycle depend on each other and stay sequential,
+        but separate cycles share nothing except the vendor pool, so their
+        simulated network waits can overlap.
+        
+        Args:
+            amounts: Amounts to transmigrate, one cycle per amount
+            source_id: Source data identifier prefix (suffixed with the index)
+            
+        Returns:
+            Final BearerToken objects for each cycle, in input order
+        """
+        self.logger.info(
+            f"[OBFUSCATION_BATCH_START] Starting {len(amounts)} concurrent transmigrations"
+        )
+        
+        results = await asyncio.gather(*(
+            self.iterative_obfuscation_loop(amount, f"{source_id}_{i}")
+            for i, amount in enumerate(amounts)
+        ))
+        
+        self.logger.info(
+            f"[OBFUSCATION_BATCH_COMPLETE] Completed {len(results)} transmigrations"
+        )
+        
+        return list(results)
+    
+    def reset_stats(self):
+        """Reset statistics on every vendor so the pool can be reused."""
+        for mint in self.vendor_pool:
+            mint.reset_stats()
+    
+    def get_vendor_statistics(self, detailed: bool = False) -> dict:
+        """
+        Get statistics for all vendors in the pool.
+        
+        Args:
+            detailed: Also include the per-vendor get_stats() listing
+            
+        Returns:
+            Dictionary with the vendor count, pool-wide totals and,
+            if requested, per-vendor statistics
+        """
         stats = {
             'total_vendors': len(self.vendor_pool),
-            'vendors': [mint.get_stats() for mint in self.vendor_pool]
+            'totals': MockMint.aggregate_stats(self.vendor_pool)
         }
+        if detailed:
+            stats['vendors'] = [mint.get_stats() for mint in self.vendor_pool]
         return stats
 
 
@@ -13,22 +13,47 @@ Comprehensive tests for the eCash transmigration system including:
 import asyncio
 import logging
 import os
+import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import List, NamedTuple, Tuple
 
 from mock_mint import BearerToken, MockMint
-from orchestrator import DigitalPurgatoryOrchestrator, setup_logging
+from orchestrator import DigitalPurgatoryOrchestrator, flush_logging, setup_logging
+
+try:
+    import uvloop  # Optional: faster event loop for the runner
+except ImportError:
+    uvloop = None
+
+# Divider lines for the console report
+_BAR = "=" * 80
+_THIN = "-" * 80
+
+
+class TestDetail(NamedTuple):
+    """A single recorded test result."""
+    
+    __test__ = False  # Not a pytest test class
+    
+    name: str
+    status: str
+    passed: bool
+    details: str
 
 
 class TestResults:
     """Track test results and statistics."""
     
+    __test__ = False  # Not a pytest test class
+    
     def __init__(self):
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
-        self.test_details = []
+        self.test_details: List[TestDetail] = []
     
     def add_result(self, test_name: str, passed: bool, details: str = ""):
         """Add a test result."""
@@ -40,99 +65,149 @@ class TestResults:
             self.failed_tests += 1
             status = "✗ FAIL"
         
-        self.test_details.append({
-            'name': test_name,
-            'status': status,
-            'passed': passed,
-            'details': details
-        })
+        self.test_details.append(TestDetail(test_name, status, passed, details))
+    
+    def check(self, test_name: str, condition, ok_details: str = "", fail_details: str = "") -> bool:
+        """
+        Record a pass/fail result for a condition without raising.
+        
+        Later checks in the same suite still run after a failure, and each
+        failure is attributed to its own check.
+        
+        Returns:
+            Whether the check passed
+        """
+        passed = bool(condition)
+        self.add_result(test_name, passed, ok_details if passed else fail_details)
+        return passed
+    
+    def counters(self) -> Tuple[int, int, int]:
+        """Return (total, passed, failed) test counts."""
+        return (self.total_tests, self.passed_tests, self.failed_tests)
     
     def print_summary(self):
         """Print test summary."""
-        print("\n" + "=" * 80)
-        print("TEST SUMMARY")
-        print("=" * 80)
+        # Let queued log lines reach the console before the summary
+        flush_logging()
         
-        for test in self.test_details:
-            print(f"{test['status']} - {test['name']}")
-            if test['details']:
-                print(f"         {test['details']}")
+        # Build the whole summary and emit it with a single write
+        lines = ["", _BAR, "TEST SUMMARY", _BAR]
         
-        print("\n" + "-" * 80)
-        print(f"Total Tests: {self.total_tests}")
-        print(f"Passed: {self.passed_tests}")
-        print(f"Failed: {self.failed_tests}")
-        print(f"Success Rate: {(self.passed_tests/self.total_tests*100):.1f}%")
-        print("=" * 80 + "\n")
+        for test in self.test_details:
+            lines.append(f"{test.status} - {test.name}")
+            if test.details:
+                lines.append(f"         {test.details}")
+        
+        lines += [
+            "",
+            _THIN,
+            f"Total Tests: {self.total_tests}",
+            f"Passed: {self.passed_tests}",
+            f"Failed: {self.failed_tests}",
+            f"Success Rate: {100.0 * self.passed_tests / max(self.total_tests, 1):.1f}%",
+            _BAR,
+            ""
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return self.failed_tests == 0
 
 
-async def test_mock_mint_basic():
+async def suite_mock_mint_basic():
     """Test 1: Basic MockMint functionality."""
     print("\n[TEST 1] Testing MockMint basic operations...")
     
     results = TestResults()
     
     try:
-        # Create two mints
+        # Create mints (Mint C keeps token history)
         mint_a = MockMint(name="TestMintA")
         mint_b = MockMint(name="TestMintB")
+        mint_c = MockMint(name="TestMintC", retain_history=True)
         
-        # Test minting
-        tokens = await mint_a.mint_tokens(1000, source_data="test_source")
-        assert len(tokens) == 1, "Should mint 1 token"
-        assert tokens[0].amount == 1000, "Token amount should be 1000"
-        assert tokens[0].mint_id == mint_a.mint_id, "Token should have correct mint ID"
-        results.add_result("MockMint: Token Minting", True, f"Minted token: {tokens[0].token_id}")
-        
-        # Test redemption
+        # Minting at A and C is independent, so overlap the two round trips
+        tokens, history_tokens = await asyncio.gather(
+            mint_a.mint_tokens(1000, source_data="test_source"),
+            mint_c.mint_tokens(500)
+        )
         redemption = await mint_b.redeem_tokens(tokens)
-        assert redemption['total_amount'] == 1000, "Redemption amount should match"
-        assert redemption['mint_id'] == mint_b.mint_id, "Redemption should be at correct mint"
-        results.add_result("MockMint: Token Redemption", True, f"Redeemed {redemption['total_amount']} units")
-        
-        # Test statistics
-        stats_a = mint_a.get_stats()
-        assert stats_a['total_minted'] == 1, "Mint A should show 1 mint operation"
-        results.add_result("MockMint: Statistics Tracking", True, f"Stats: {stats_a['total_minted']} minted")
-        
     except Exception as e:
         results.add_result("MockMint Basic Operations", False, f"Error: {str(e)}")
+        return results
+    
+    # Test minting
+    results.check(
+        "MockMint: Token Minting",
+        len(tokens) == 1 and tokens[0].amount == 1000 and tokens[0].mint_id == mint_a.mint_id,
+        f"Minted token: {tokens[0].token_id if tokens else None}",
+        f"Expected 1 token of 1000 from {mint_a.name}, got {tokens}"
+    )
+    
+    # Test redemption
+    results.check(
+        "MockMint: Token Redemption",
+        redemption.total_amount == 1000 and redemption.mint_id == mint_b.mint_id,
+        f"Redeemed {redemption.total_amount} units",
+        f"Unexpected redemption: {redemption}"
+    )
+    
+    # Test statistics
+    stats_a = mint_a.get_stats()
+    results.check(
+        "MockMint: Statistics Tracking",
+        stats_a['total_minted'] == 1,
+        f"Stats: {stats_a['total_minted']} minted",
+        f"Mint A should show 1 mint operation, got {stats_a['total_minted']}"
+    )
+    
+    # Test optional token history
+    results.check(
+        "MockMint: Token History",
+        not mint_a.issued_tokens
+        and bool(history_tokens)
+        and history_tokens[0].token_id in mint_c.issued_tokens
+        and mint_c.get_stats()['active_tokens'] == 1,
+        "History retained only when requested",
+        "History should be kept only with retain_history=True"
+    )
     
     return results
 
 
-async def test_vendor_discovery():
+async def suite_vendor_discovery(orchestrator: DigitalPurgatoryOrchestrator):
     """Test 2: Vendor discovery system."""
     print("\n[TEST 2] Testing vendor discovery...")
     
     results = TestResults()
+    pool = orchestrator.vendor_pool
     
-    try:
-        orchestrator = DigitalPurgatoryOrchestrator(num_hops=10, num_mints=15)
-        await orchestrator.discover_vendors()
-        
-        assert len(orchestrator.vendor_pool) == 15, "Should discover 15 vendors"
-        results.add_result("Vendor Discovery: Pool Size", True, f"Discovered {len(orchestrator.vendor_pool)} vendors")
-        
-        # Verify each mint is unique
-        mint_ids = [mint.mint_id for mint in orchestrator.vendor_pool]
-        assert len(mint_ids) == len(set(mint_ids)), "All mint IDs should be unique"
-        results.add_result("Vendor Discovery: Uniqueness", True, "All mint IDs unique")
-        
-        # Verify vendor naming
-        first_vendor = orchestrator.vendor_pool[0]
-        assert first_vendor.name.startswith("Vendor-"), "Vendor should have correct naming"
-        results.add_result("Vendor Discovery: Naming", True, f"Example: {first_vendor.name}")
-        
-    except Exception as e:
-        results.add_result("Vendor Discovery", False, f"Error: {str(e)}")
+    results.check(
+        "Vendor Discovery: Pool Size",
+        len(pool) == 15,
+        f"Discovered {len(pool)} vendors",
+        f"Should discover 15 vendors, got {len(pool)}"
+    )
+    
+    # Verify each mint is unique
+    results.check(
+        "Vendor Discovery: Uniqueness",
+        len(orchestrator.mint_id_set) == len(pool),
+        "All mint IDs unique",
+        "All mint IDs should be unique"
+    )
+    
+    # Verify vendor naming
+    results.check(
+        "Vendor Discovery: Naming",
+        bool(pool) and pool[0].name.startswith("Vendor-"),
+        f"Example: {pool[0].name if pool else None}",
+        "Vendor should have correct naming"
+    )
     
     return results
 
 
-async def test_single_hop():
+async def suite_single_hop():
     """Test 3: Single hop transmigration (Mint A -> Mint B)."""
     print("\n[TEST 3] Testing single hop transmigration...")
     
@@ -142,10 +217,11 @@ async def test_single_hop():
         mint_a = MockMint(name="HopTestA")
         mint_b = MockMint(name="HopTestB")
         
+        # Each step consumes the previous step's output, so this hop is
+        # inherently sequential and cannot be gathered
+        
         # Mint at A
         initial_tokens = await mint_a.mint_tokens(5000, source_data="hop_test_source")
-        initial_token_id = initial_tokens[0].token_id
-        initial_mint_id = initial_tokens[0].mint_id
         results.add_result("Single Hop: Initial Minting", True, f"Minted at {mint_a.name}")
         
         # Redeem at B
@@ -153,225 +229,545 @@ async def test_single_hop():
         results.add_result("Single Hop: Redemption", True, f"Redeemed at {mint_b.name}")
         
         # Mint fresh tokens at B
-        new_tokens = await mint_b.mint_tokens(redemption['total_amount'])
-        new_token_id = new_tokens[0].token_id
-        new_mint_id = new_tokens[0].mint_id
+        new_tokens = await mint_b.mint_tokens(redemption.total_amount)
         results.add_result("Single Hop: Fresh Minting", True, f"New token at {mint_b.name}")
-        
-        # Verify custody chain is severed
-        assert initial_token_id != new_token_id, "Token IDs should differ"
-        assert initial_mint_id != new_mint_id, "Mint IDs should differ"
-        assert new_tokens[0].amount == initial_tokens[0].amount, "Amount should be preserved"
-        results.add_result(
-            "Single Hop: Custody Chain Severance", 
-            True, 
-            f"Old: {initial_token_id} -> New: {new_token_id}"
-        )
-        
     except Exception as e:
         results.add_result("Single Hop Transmigration", False, f"Error: {str(e)}")
+        return results
+    
+    # Verify custody chain is severed
+    initial_token = initial_tokens[0] if initial_tokens else None
+    new_token = new_tokens[0] if new_tokens else None
+    results.check(
+        "Single Hop: Custody Chain Severance",
+        initial_token is not None and new_token is not None
+        and initial_token.token_id != new_token.token_id
+        and initial_token.mint_id != new_token.mint_id
+        and new_token.amount == initial_token.amount,
+        f"Old: {getattr(initial_token, 'token_id', None)} -> "
+        f"New: {getattr(new_token, 'token_id', None)}",
+        f"Token and mint IDs should differ with amount preserved: {initial_token} -> {new_token}"
+    )
     
     return results
 
 
-async def test_full_transmigration():
+async def suite_full_transmigration(orchestrator: DigitalPurgatoryOrchestrator):
     """Test 4: Full 10-hop transmigration cycle."""
     print("\n[TEST 4] Testing full 10-hop transmigration cycle...")
     
     results = TestResults()
     
+    initial_amount = 25000
+    source_id = "full_test_source"
+    
     try:
-        orchestrator = DigitalPurgatoryOrchestrator(num_hops=10, num_mints=15)
-        await orchestrator.discover_vendors()
-        
-        initial_amount = 25000
-        source_id = "full_test_source"
-        
         # Execute full transmigration
-        start_time = datetime.now()
+        start = time.perf_counter()
         final_tokens = await orchestrator.iterative_obfuscation_loop(initial_amount, source_id)
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
-        
-        # Verify results
-        assert len(final_tokens) > 0, "Should have final tokens"
-        results.add_result("Full Transmigration: Execution", True, f"Completed in {duration:.2f}s")
-        
-        assert final_tokens[0].amount == initial_amount, "Amount should be preserved"
-        results.add_result("Full Transmigration: Amount Preservation", True, f"{initial_amount} units preserved")
-        
-        # Verify statistics
-        stats = orchestrator.get_vendor_statistics()
-        total_operations = sum(v['total_minted'] + v['total_redeemed'] for v in stats['vendors'])
-        results.add_result(
-            "Full Transmigration: Operations Count", 
-            True, 
-            f"{total_operations} total operations across {stats['total_vendors']} vendors"
-        )
-        
-        # Verify hops
-        # Initial mint + 10 hops = 11 mint operations total
-        expected_mint_ops = 11
-        total_mints = sum(v['total_minted'] for v in stats['vendors'])
-        assert total_mints == expected_mint_ops, f"Should have {expected_mint_ops} mint operations"
-        results.add_result("Full Transmigration: Hop Count", True, f"{total_mints} mint operations (1 initial + 10 hops)")
-        
+        duration = time.perf_counter() - start
     except Exception as e:
         results.add_result("Full Transmigration Cycle", False, f"Error: {str(e)}")
+        return results
+    
+    # Verify results
+    results.check(
+        "Full Transmigration: Execution",
+        len(final_tokens) > 0,
+        f"Completed in {duration:.2f}s",
+        "Should have final tokens"
+    )
+    
+    results.check(
+        "Full Transmigration: Amount Preservation",
+        bool(final_tokens) and final_tokens[0].amount == initial_amount,
+        f"{initial_amount} units preserved",
+        "Amount should be preserved"
+    )
+    
+    # Verify statistics
+    stats = orchestrator.get_vendor_statistics(detailed=True)
+    total_mints = 0
+    total_redeems = 0
+    for v in stats['vendors']:
+        total_mints += v['total_minted']
+        total_redeems += v['total_redeemed']
+    total_operations = total_mints + total_redeems
+    results.add_result(
+        "Full Transmigration: Operations Count", 
+        True, 
+        f"{total_operations} total operations across {stats['total_vendors']} vendors"
+    )
+    
+    # Verify hops
+    # Initial mint + 10 hops = 11 mint operations total
+    expected_mint_ops = 11
+    results.check(
+        "Full Transmigration: Hop Count",
+        total_mints == expected_mint_ops,
+        f"{total_mints} mint operations (1 initial + 10 hops)",
+        f"Should have {expected_mint_ops} mint operations, got {total_mints}"
+    )
+    
+    results.check(
+        "Full Transmigration: Aggregate Totals",
+        stats['totals']['total_minted'] == total_mints,
+        f"Totals: {stats['totals']}",
+        "Aggregate totals should match per-vendor sum"
+    )
     
     return results
 
 
-async def test_custody_chain_severance():
+async def suite_custody_chain_severance(orchestrator: DigitalPurgatoryOrchestrator):
     """Test 5: Verify custody chain is completely severed."""
     print("\n[TEST 5] Testing custody chain severance verification...")
     
     results = TestResults()
     
+    initial_amount = 10000
+    source_id = "custody_test_source"
+    
     try:
-        orchestrator = DigitalPurgatoryOrchestrator(num_hops=10, num_mints=15)
-        await orchestrator.discover_vendors()
-        
-        initial_amount = 10000
-        source_id = "custody_test_source"
-        
-        # Track initial state
-        initial_source = source_id
-        
         # Execute transmigration
         final_tokens = await orchestrator.iterative_obfuscation_loop(initial_amount, source_id)
-        
-        # The final token should have NO relationship to the original source
-        # Verify through different attributes
-        final_token = final_tokens[0]
-        
-        # Token data should be different (randomly generated at each hop)
-        # Mint ID should be from one of the vendors
-        assert final_token.mint_id in [m.mint_id for m in orchestrator.vendor_pool], \
-            "Final token should be from vendor pool"
-        results.add_result("Custody Severance: Mint Verification", True, "Final mint is from pool")
-        
-        # Amount preserved but all other data is new
-        assert final_token.amount == initial_amount, "Amount should be preserved"
-        results.add_result("Custody Severance: Amount Integrity", True, f"{initial_amount} units intact")
-        
-        # Token should have been created recently (timestamp check)
-        import time
-        current_time = time.time()
-        token_age = current_time - final_token.timestamp
-        assert token_age < 60, "Token should be less than 60 seconds old"
-        results.add_result("Custody Severance: Fresh Token", True, f"Token age: {token_age:.2f}s")
-        
-        results.add_result(
-            "Custody Severance: Complete Verification",
-            True,
-            "No traceable link between source and final token"
-        )
-        
     except Exception as e:
         results.add_result("Custody Chain Severance", False, f"Error: {str(e)}")
+        return results
+    
+    # Snapshot wall-clock time once for every age check below (token
+    # timestamps are Unix epoch, so time.time rather than perf_counter)
+    now = time.time()
+    
+    # The final token should have NO relationship to the original source
+    # Verify through different attributes
+    if not final_tokens:
+        results.add_result("Custody Chain Severance", False, "No final token returned")
+        return results
+    final_token = final_tokens[0]
+
+    # Token data should be different (randomly generated at each hop)
+    # Mint ID should be from one of the vendors
+    mint_ok = results.check(
+        "Custody Severance: Mint Verification",
+        final_token.mint_id in orchestrator.mint_id_set,
+        "Final mint is from pool",
+        "Final token should be from vendor pool"
+    )
+    
+    # Amount preserved but all other data is new
+    amount_ok = results.check(
+        "Custody Severance: Amount Integrity",
+        final_token.amount == initial_amount,
+        f"{initial_amount} units intact",
+        "Amount should be preserved"
+    )
+    
+    # Token should have been created recently (timestamp check)
+    token_age = now - final_token.timestamp
+    fresh_ok = results.check(
+        "Custody Severance: Fresh Token",
+        token_age < 60,
+        f"Token age: {token_age:.2f}s",
+        f"Token should be less than 60 seconds old, is {token_age:.2f}s"
+    )
+    
+    results.check(
+        "Custody Severance: Complete Verification",
+        mint_ok and amount_ok and fresh_ok,
+        "No traceable link between source and final token",
+        "One or more severance checks failed"
+    )
     
     return results
 
 
-async def test_logging_verification():
-    """Test 6: Verify logging system is working."""
-    print("\n[TEST 6] Testing logging verification...")
+async def suite_batch_transmigration():
+    """Test 6: Concurrent batch of independent transmigrations."""
+    print("\n[TEST 6] Testing concurrent batch transmigration...")
     
     results = TestResults()
     
+    amounts = [1000, 2000, 3000]
+    
     try:
-        log_file = Path("dfir/orchestrator.log")
-        
-        # Check if log file exists
-        assert log_file.exists(), "Log file should exist"
-        results.add_result("Logging: File Existence", True, f"Log file: {log_file}")
-        
-        # Read log content
-        log_content = log_file.read_text()
-        
-        # Verify key log entries
-        assert "[ORCHESTRATOR_INIT]" in log_content, "Should contain orchestrator init logs"
-        results.add_result("Logging: Orchestrator Init", True, "Orchestrator initialization logged")
-        
-        assert "[VENDOR_DISCOVERY]" in log_content, "Should contain vendor discovery logs"
-        results.add_result("Logging: Vendor Discovery", True, "Vendor discovery logged")
-        
-        assert "[HOP_" in log_content, "Should contain hop logs"
-        results.add_result("Logging: Hop Operations", True, "Hop operations logged")
-        
-        assert "[MINT_TOKENS]" in log_content, "Should contain mint logs"
-        results.add_result("Logging: Mint Operations", True, "Mint operations logged")
-        
-        assert "[REDEEM_TOKEN]" in log_content, "Should contain redeem logs"
-        results.add_result("Logging: Redeem Operations", True, "Redeem operations logged")
-        
-        # Count log lines
-        log_lines = log_content.strip().split('\n')
-        results.add_result("Logging: Volume", True, f"{len(log_lines)} log entries recorded")
+        orchestrator = DigitalPurgatoryOrchestrator(num_hops=10, num_mints=15)
+        await orchestrator.discover_vendors()
         
+        batch_tokens = await orchestrator.iterative_obfuscation_batch(amounts, "batch_test_source")
     except Exception as e:
+        results.add_result("Batch Transmigration", False, f"Error: {str(e)}")
+        return results
+    
+    results.check(
+        "Batch Transmigration: Execution",
+        len(batch_tokens) == len(amounts),
+        f"{len(batch_tokens)} cycles completed",
+        f"Should return one result per amount, got {len(batch_tokens)}"
+    )
+    
+    final_amounts = [tokens[0].amount if tokens else None for tokens in batch_tokens]
+    results.check(
+        "Batch Transmigration: Amount Preservation",
+        final_amounts == amounts,
+        f"Amounts: {final_amounts}",
+        f"Amounts should be preserved in input order, got {final_amounts}"
+    )
+    
+    stats = orchestrator.get_vendor_statistics(detailed=True)
+    total_mints = sum(v['total_minted'] for v in stats['vendors'])
+    expected_mint_ops = len(amounts) * 11
+    results.check(
+        "Batch Transmigration: Hop Count",
+        total_mints == expected_mint_ops,
+        f"{total_mints} mint operations",
+        f"Should have {expected_mint_ops} mint operations, got {total_mints}"
+    )
+    
+    # Tokens from several mints consolidate into one fresh token at the target
+    try:
+        source_tokens = [tokens[0] for tokens in batch_tokens if tokens]
+        target_mint = orchestrator.vendor_pool[0]
+        merged = await orchestrator.execute_cross_vendor_redemption(
+            source_tokens, target_mint, orchestrator.num_hops + 1
+        )
+    except Exception as e:
+        results.add_result("Batch Transmigration: Multi-Token Redemption", False, f"Error: {str(e)}")
+        return results
+    
+    results.check(
+        "Batch Transmigration: Multi-Token Redemption",
+        len(merged) == 1
+        and merged[0].amount == sum(amounts)
+        and merged[0].mint_id == target_mint.mint_id,
+        f"{len(source_tokens)} tokens -> {merged[0].amount if merged else None} units at {target_mint.name}",
+        f"Expected one token of {sum(amounts)} from {target_mint.name}, got {merged}"
+    )
+    
+    return results
+
+
+# Markers the log must contain, mapped to the label each check reports
+REQUIRED_LOG_MARKERS = {
+    b"[ORCHESTRATOR_INIT]": "Orchestrator Init",
+    b"[VENDOR_DISCOVERY]": "Vendor Discovery",
+    b"[HOP_": "Hop Operations",
+    b"[MINT_TOKENS]": "Mint Operations",
+    b"[REDEEM_TOKEN]": "Redeem Operations"
+}
+
+# One alternation over every marker (longest first), and the number of bytes
+# a marker can straddle across a chunk boundary
+_LOG_MARKER_PATTERN = re.compile(
+    b"|".join(re.escape(m) for m in sorted(REQUIRED_LOG_MARKERS, key=len, reverse=True))
+)
+_LOG_MARKER_OVERLAP = max(len(m) for m in REQUIRED_LOG_MARKERS) - 1
+
+
+def scan_log_markers(log_file: Path, pattern, overlap: int, chunk_size: int = 64 * 1024):
+    """
+    Stream a log file once, collecting markers present and counting lines.
+    
+    The file is read in binary chunks, so memory use does not grow with the
+    log size. All markers are matched by one compiled alternation, so each
+    chunk is scanned once regardless of how many markers are checked.
+    
+    Args:
+        log_file: Log file to scan
+        pattern: Compiled bytes pattern matching any of the markers
+        overlap: Bytes of each chunk's tail carried into the next scan, so
+            markers split across a chunk boundary are still found; one less
+            than the longest marker
+        chunk_size: Bytes read per chunk
+    
+    Returns:
+        Tuple of (set of markers found, number of lines)
+    """
+    found = set()
+    line_count = 0
+    tail = b""
+    last_byte = b""
+    
+    with open(log_file, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            line_count += chunk.count(b'\n')
+            window = tail + chunk
+            found.update(pattern.findall(window))
+            tail = window[-overlap:] if overlap else b""
+            last_byte = chunk[-1:]
+    
+    # Count a final line that has no trailing newline
+    if last_byte and last_byte != b'\n':
+        line_count += 1
+    
+    return found, line_count
+
+
+async def suite_logging_verification():
+    """Test 7: Verify logging system is working."""
+    print("\n[TEST 7] Testing logging verification...")
+    
+    results = TestResults()
+    
+    log_file = Path("dfir/orchestrator.log")
+    
+    # Check if log file exists
+    if not results.check(
+        "Logging: File Existence",
+        log_file.exists(),
+        f"Log file: {log_file}",
+        f"Log file should exist: {log_file}"
+    ):
+        return results
+    
+    try:
+        # Scan the log once for every required marker
+        found, line_count = scan_log_markers(
+            log_file, _LOG_MARKER_PATTERN, _LOG_MARKER_OVERLAP
+        )
+    except OSError as e:
         results.add_result("Logging Verification", False, f"Error: {str(e)}")
+        return results
+    
+    # Verify key log entries
+    for marker, label in REQUIRED_LOG_MARKERS.items():
+        tag = marker.decode()
+        results.check(f"Logging: {label}", marker in found, f"{tag} logged", f"Should contain {tag} logs")
+    
+    # Count log lines
+    results.add_result("Logging: Volume", True, f"{line_count} log entries recorded")
+    
+    # Repeated setup must not stack handlers (which would duplicate records)
+    handler_count = len(logging.getLogger().handlers)
+    setup_logging()
+    results.check(
+        "Logging: Idempotent Setup",
+        len(logging.getLogger().handlers) == handler_count,
+        f"{handler_count} root handler(s) after re-setup",
+        "setup_logging should be idempotent"
+    )
     
     return results
 
 
+# Suites in report order, flagged when they run against the shared vendor
+# pool. Logging verification is not listed: it reads what these suites
+# wrote, so main() runs it last.
+SUITES = (
+    (suite_mock_mint_basic, False),
+    (suite_vendor_discovery, True),
+    (suite_single_hop, False),
+    (suite_full_transmigration, True),
+    (suite_custody_chain_severance, True),
+    (suite_batch_transmigration, False),
+)
+
+
+async def run_suite_group(test_funcs, orchestrator=None, failure=None):
+    """
+    Run suites one after another.
+    
+    Suites given a shared orchestrator get its statistics reset first, so
+    each one sees a pristine vendor pool. A suite that raises is recorded
+    as a failure under its own name and the group moves on to the next
+    one, setting ``failure`` (if given) so fail-fast mode can react. If the
+    group is cancelled, the results collected so far are returned along
+    with a cancelled result for each suite that did not finish.
+    """
+    group_results = []
+    for test_func in test_funcs:
+        try:
+            if orchestrator is None:
+                group_results.append(await test_func())
+            else:
+                orchestrator.reset_stats()
+                group_results.append(await test_func(orchestrator))
+        except asyncio.CancelledError:
+            # Record the interrupted suite and every one it kept from running
+            for skipped in test_funcs[len(group_results):]:
+                cancelled = TestResults()
+                cancelled.add_result(skipped.__name__, False, "Cancelled (fail-fast)")
+                group_results.append(cancelled)
+            break
+        except Exception as e:
+            failed = TestResults()
+            failed.add_result(test_func.__name__, False, f"Error: {e!r}")
+            group_results.append(failed)
+            if failure is not None:
+                failure.set()
+    return group_results
+
+
+async def run_suites(suites, fail_fast: bool = False) -> List[TestResults]:
+    """
+    Run a table of suites and return their results in table order.
+    
+    Suites flagged as shared run in order against one discovered vendor
+    pool; the rest run concurrently. With ``fail_fast`` the remaining
+    groups are cancelled as soon as one suite fails.
+    """
+    # The shared suites get one discovered vendor pool instead of each
+    # rebuilding it; they read pool statistics, so they run in order
+    shared_orchestrator = DigitalPurgatoryOrchestrator(num_hops=10, num_mints=15)
+    try:
+        await shared_orchestrator.discover_vendors()
+        discovery_error = None
+    except Exception as e:
+        discovery_error = e
+    
+    suite_groups = [([suite], None) for suite, shared in suites if not shared]
+    shared_suites = [suite for suite, shared in suites if shared]
+    
+    results_by_suite = {}
+    if discovery_error is None:
+        suite_groups.append((shared_suites, shared_orchestrator))
+    else:
+        # Without a vendor pool the shared suites cannot run; fail each one
+        for suite in shared_suites:
+            failed = TestResults()
+            failed.add_result(
+                suite.__name__, False,
+                f"Vendor discovery failed: {discovery_error!r}"
+            )
+            results_by_suite[suite] = failed
+    
+    # Independent groups share no state, so run them concurrently
+    failure = asyncio.Event()
+    tasks = [
+        asyncio.ensure_future(run_suite_group(funcs, orchestrator, failure))
+        for funcs, orchestrator in suite_groups
+    ]
+    
+    if fail_fast:
+        # Cancel the remaining groups as soon as one suite fails
+        failed_waiter = asyncio.ensure_future(failure.wait())
+        pending = {failed_waiter, *tasks}
+        while not failure.is_set() and pending - {failed_waiter}:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+    
+    gathered = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    for (funcs, _), group_results in zip(suite_groups, gathered):
+        if isinstance(group_results, BaseException):
+            # Only a group cancelled before it started gets here; fail each suite
+            error, group_results = group_results, []
+            for test_func in funcs:
+                failed = TestResults()
+                failed.add_result(test_func.__name__, False, f"Error: {error!r}")
+                group_results.append(failed)
+        results_by_suite.update(zip(funcs, group_results))
+    
+    # Every suite keeps its report slot, even if nothing recorded a result
+    all_results = []
+    for suite, _ in suites:
+        if suite not in results_by_suite:
+            missing = TestResults()
+            missing.add_result(suite.__name__, False, "No result recorded")
+            results_by_suite[suite] = missing
+        all_results.append(results_by_suite[suite])
+    return all_results
+
+
 async def main():
     """Run all tests."""
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("DIGITAL PURGATORY PROTOCOL - COMPREHENSIVE TEST SUITE")
-    print("=" * 80)
+    print(_BAR)
     print(f"Started at: {datetime.now().isoformat()}")
-    print("=" * 80)
+    print(_BAR)
     
     # Setup logging
     setup_logging()
     
-    # Run all tests
-    all_results = []
+    all_results = await run_suites(SUITES, fail_fast=bool(os.getenv("PURGATORY_FAILFAST")))
     
-    test_functions = [
-        test_mock_mint_basic,
-        test_vendor_discovery,
-        test_single_hop,
-        test_full_transmigration,
-        test_custody_chain_severance,
-        test_logging_verification
-    ]
+    # Logging verification reads what the other suites wrote, so it runs
+    # last, once their queued records have reached the log file
+    flush_logging()
+    all_results.append(await suite_logging_verification())
     
-    for test_func in test_functions:
-        result = await test_func()
-        all_results.append(result)
+    # Keep queued console lines ahead of the report
+    flush_logging()
     
-    # Aggregate results
-    print("\n" + "=" * 80)
-    print("AGGREGATE TEST RESULTS")
-    print("=" * 80)
+    total_tests = total_passed = total_failed = 0
+    for r in all_results:
+        tests, passed, failed = r.counters()
+        total_tests += tests
+        total_passed += passed
+        total_failed += failed
     
-    total_tests = sum(r.total_tests for r in all_results)
-    total_passed = sum(r.passed_tests for r in all_results)
-    total_failed = sum(r.failed_tests for r in all_results)
+    # Aggregate results, emitted with a single write
+    lines = ["", _BAR, "AGGREGATE TEST RESULTS", _BAR]
     
     for i, result in enumerate(all_results, 1):
-        print(f"\nTest Suite {i}: {result.passed_tests}/{result.total_tests} passed")
+        lines += ["", f"Test Suite {i}: {result.passed_tests}/{result.total_tests} passed"]
         for test in result.test_details:
-            print(f"  {test['status']} - {test['name']}")
+            lines.append(f"  {test.status} - {test.name}")
     
-    print("\n" + "=" * 80)
-    print(f"OVERALL: {total_passed}/{total_tests} tests passed")
-    print(f"Success Rate: {(total_passed/total_tests*100):.1f}%")
-    print(f"Completed at: {datetime.now().isoformat()}")
-    print("=" * 80)
+    lines += [
+        "",
+        _BAR,
+        f"OVERALL: {total_passed}/{total_tests} tests passed",
+        f"Success Rate: {100.0 * total_passed / max(total_tests, 1):.1f}%",
+        f"Completed at: {datetime.now().isoformat()}",
+        _BAR,
+        ""
+    ]
     
     # Return exit code
     if total_failed == 0:
-        print("\n✓ ALL TESTS PASSED!")
-        return 0
+        lines.append("✓ ALL TESTS PASSED!")
+        exit_code = 0
     else:
-        print(f"\n✗ {total_failed} TESTS FAILED")
-        return 1
+        lines.append(f"✗ {total_failed} TESTS FAILED")
+        exit_code = 1
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return exit_code
+
+
+def test_all_suites():
+    """
+    pytest entry point: run every suite through the runner.
+    
+    The async suites take runner-managed fixtures (such as the shared
+    orchestrator), so pytest collects only this function and fails it if
+    any recorded check fails.
+    """
+    assert asyncio.run(main()) == 0, "One or more test suites failed"
+
+
+def test_failfast_reports_every_suite():
+    """Fail-fast cancellation still leaves one result per suite."""
+    async def suite_raises():
+        raise RuntimeError("boom")
+    
+    async def suite_waits(orchestrator):
+        await asyncio.sleep(60)
+        return TestResults()
+    
+    async def suite_never_reached(orchestrator):
+        return TestResults()
+    
+    suites = (
+        (suite_raises, False),
+        (suite_waits, True),
+        (suite_never_reached, True),
+    )
+    results = asyncio.run(run_suites(suites, fail_fast=True))
+    
+    assert [r.test_details[0].name for r in results] == [s.__name__ for s, _ in suites]
+    assert [r.test_details[0].details for r in results] == [
+        "Error: RuntimeError('boom')",
+        "Cancelled (fail-fast)",
+        "Cancelled (fail-fast)",
+    ]
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop.run needs uvloop >= 0.18; otherwise use the default loop
+    run = getattr(uvloop, "run", asyncio.run)
+    exit_code = run(main())
     sys.exit(exit_code)